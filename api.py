@@ -1,193 +1,876 @@
-import pandas as pd
-from sqlalchemy import create_engine, inspect, text
-from decouple import config
-import time
-
-
-DATABASE_HOST = config("DATABASE_HOST")
-DATABASE_USERNAME = config("DATABASE_USERNAME")
-DATABASE_PASSWORD = config("DATABASE_PASSWORD")
-DATABASE_NAME = config("DATABASE_NAME")
-
-
-def measure_execution_time(func):
-    """
-    Декоратор для измерения времени выполнения функции.
-
-    Args:
-        func: Функция, к которой применяется декоратор.
-
-    Returns:
-        wrapper: Обертка вокруг исходной функции с измерением времени выполнения.
-
-    """
-    def wrapper(*args, **kwargs):
-        start_time = time.time()
-        result = func(*args, **kwargs)
-        end_time = time.time()
-        execution_time = end_time - start_time
-        formatted_time = time.strftime("%H-%M-%S", time.gmtime(execution_time))
-        print(f"Время выполнения: {formatted_time}")
-        return result
-
-    return wrapper
-
-
-class DatabaseAPI:
-    def __init__(self, host, username, password, database_name):
-        """
-        Инициализация объекта DatabaseAPI.
-
-        Args:
-            host (str): Хост базы данных.\n
-            username (str): Имя пользователя для подключения к базе данных.\n
-            password (str): Пароль пользователя для подключения к базе данных.\n
-            database_name (str): Имя базы данных.
-
-        """
-        self.host = host
-        self.username = username
-        self.password = password
-        self.database_name = database_name
-        self.engine = self.create_connection()
-
-    def create_connection(self):
-        """
-        Создание соединения с базой данных.
-
-        Returns:
-            engine: Объект SQLAlchemy Engine для подключения к базе данных.
-
-        """
-        connection_url = f"postgresql+psycopg2://{self.username}:{self.password}@{self.host}/{self.database_name}"
-        engine = create_engine(connection_url)
-        return engine
-
-    @measure_execution_time
-    def create_table(self, table_name, dataframe):
-        """
-        Создание таблицы в базе данных на основе DataFrame.
-
-        Args:
-            table_name (str): Имя таблицы.\n
-            dataframe (pd.DataFrame): DataFrame, который будет использован для создания таблицы.
-
-        """
-        inspector = inspect(self.engine)
-        if table_name in inspector.get_table_names():
-            print(f"Таблица {table_name} уже существует. Нельзя создать таблицу.")
-        else:
-            dataframe.to_sql(table_name, self.engine, index=False)
-            print(f"Таблица {table_name} успешно создана.")
-
-    @measure_execution_time
-    def insert_sql(self, table_name, dataframe, mode):
-        """
-        Вставка данных в таблицу базы данных.
-
-        Args:
-            table_name (str): Имя таблицы, в которую будут вставлены данные.\n
-            dataframe (pd.DataFrame): DataFrame, содержащий данные для вставки.\n
-            mode (str): Режим вставки ('append' или 'replace').
-
-        """
-        inspector = inspect(self.engine)
-        if table_name not in inspector.get_table_names():
-            print(
-                f"Таблица {table_name} не существует. Данные не могут быть добавлены."
-            )
-        else:
-            if mode == "append":
-                dataframe.to_sql(
-                    table_name, self.engine, if_exists="append", index=False
-                )
-                print(f"Данные успешно добавлены в таблицу {table_name}.")
-            elif mode == "replace":
-                dataframe.to_sql(
-                    table_name, self.engine, if_exists="replace", index=False
-                )
-                print(f"Данные успешно добавлены в таблицу {table_name}.")
-
-    @measure_execution_time
-    def truncate_table(self, table_name):
-        """
-        Очистка таблицы (удаление всех данных).
-
-        Args:
-            table_name (str): Имя таблицы, которую необходимо очистить.
-
-        """
-        inspector = inspect(self.engine)
-        if table_name not in inspector.get_table_names():
-            print(f"Таблица {table_name} не существует. Нельзя выполнить очистку.")
-        else:
-            with self.engine.connect() as conn:
-                truncate_query = text(f"TRUNCATE TABLE {table_name}")
-                conn.execute(truncate_query)
-                conn.commit()
-            print(f"Таблица {table_name} успешно очищена.")
-
-    @measure_execution_time
-    def read_sql(self, table_name):
-        """
-        Чтение данных из таблицы и возврат их в виде DataFrame.
-
-        Args:
-            table_name (str): Имя таблицы, из которой необходимо прочитать данные.
-
-        Returns:
-            pd.DataFrame: DataFrame с данными из таблицы.
-
-        """
-        inspector = inspect(self.engine)
-        if table_name not in inspector.get_table_names():
-            print(f"Таблица {table_name} не существует. Невозможно прочитать данные.")
-            return None
-        else:
-            query = f"SELECT * FROM {table_name}"
-            result = pd.read_sql_query(query, self.engine)
-            return result
-
-    @measure_execution_time
-    def delete_from_table(self, table_name, *columns, **conditions):
-        """
-        Удаление данных из таблицы на основе указанных столбцов и условий.
-
-        Args:
-            table_name (str): Имя таблицы, из которой необходимо удалить данные.\n
-            \*columns (str): Список столбцов, по которым выполняется условие удаления.\n
-            **conditions: Условия для удаления данных.
-
-        """
-        inspector = inspect(self.engine)
-        if table_name not in inspector.get_table_names():
-            print(f"Таблица {table_name} не существует. Невозможно удалить данные.")
-        else:
-            if not columns or not conditions:
-                print("Не указаны столбцы и условия для удаления.")
-            else:
-                with self.engine.connect() as conn:
-                    delete_query = text(
-                        f"DELETE FROM {table_name} WHERE "
-                        + " AND ".join([f"{column} = :{column}" for column in columns])
-                    )
-                    conn.execute(delete_query, conditions)
-                    conn.commit()
-                print(f"Данные в таблице {table_name} успешно удалены.")
-
-    @measure_execution_time
-    def execute(self, query):
-        """
-        Выполнение произвольного SQL-запроса.
-
-        Args:
-            query (str): SQL-запрос для выполнения.
-
-        Returns:
-            result: Результат выполнения SQL-запроса.
-
-        """
-        with self.engine.connect() as conn:
-            result = conn.execute(text(query))
-            conn.commit()
-            return result
+import csv
+import functools
+import struct
+import time
+from io import BytesIO, StringIO
+
+# Тяжелые зависимости (pandas, sqlalchemy, psycopg2, decouple) импортируются
+# лениво внутри функций: холодный импорт модуля не тянет за собой ~сотни мс
+# на библиотеки, которые короткому скрипту могут и не понадобиться.
+
+_LAZY_SETTINGS = (
+    "DATABASE_HOST",
+    "DATABASE_USERNAME",
+    "DATABASE_PASSWORD",
+    "DATABASE_NAME",
+)
+
+
+def __getattr__(name):
+    if name in _LAZY_SETTINGS:
+        from decouple import config
+
+        return config(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+EXECUTE_VALUES_THRESHOLD = 100
+COPY_THRESHOLD = 5000
+
+FAST_BULK_SETTINGS = (
+    "SET LOCAL synchronous_commit = OFF; "
+    "SET LOCAL maintenance_work_mem = '1GB'"
+)
+
+PG_BINARY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+PG_BINARY_TRAILER = struct.pack("!h", -1)
+PG_NULL_FIELD = struct.pack("!i", -1)
+# Микросекунды между эпохами Unix (1970) и PostgreSQL (2000).
+PG_EPOCH_US = 946_684_800_000_000
+
+BINARY_PACKERS = {
+    "int64": lambda value: struct.pack("!iq", 8, value),
+    "int32": lambda value: struct.pack("!ii", 4, value),
+    "float64": lambda value: struct.pack("!id", 8, value),
+    "float32": lambda value: struct.pack("!if", 4, value),
+    "bool": lambda value: struct.pack("!i?", 1, value),
+    "datetime64[ns]": lambda value: struct.pack(
+        "!iq", 8, int(value.astype("int64")) // 1000 - PG_EPOCH_US
+    ),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _exists_statement():
+    """
+    Компиляция (с кешированием) запроса проверки существования таблицы.
+
+    Текст запроса одинаков для всех таблиц (имя передается параметром),
+    поэтому компилируется ровно один раз на процесс.
+
+    Returns:
+        TextClause: Скомпилированный запрос к to_regclass.
+
+    """
+    from sqlalchemy import text
+
+    return text("SELECT to_regclass(:table_name) IS NOT NULL")
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_delete(quoted_table, columns, quoted_columns):
+    """
+    Компиляция (с кешированием) параметризованного DELETE-запроса.
+
+    Текст запроса зависит только от таблицы и столбцов, поэтому повторные
+    удаления по тем же ключам не перекомпилируют запрос, а сервер может
+    переиспользовать план.
+
+    Args:
+        quoted_table (str): Экранированное имя таблицы.\n
+        columns (tuple): Имена столбцов условия (для параметров).\n
+        quoted_columns (tuple): Экранированные имена тех же столбцов.
+
+    Returns:
+        TextClause: Скомпилированный DELETE-запрос.
+
+    """
+    from sqlalchemy import text
+
+    return text(
+        f"DELETE FROM {quoted_table} WHERE "
+        + " AND ".join(
+            f"{quoted_column} = :{column}"
+            for column, quoted_column in zip(columns, quoted_columns)
+        )
+    )
+
+
+def psql_copy_insert(table, conn, keys, data_iter):
+    """
+    Callable для параметра ``method=`` в ``pandas.to_sql``, использующий COPY.
+
+    Собирает переданные pandas строки в CSV-буфер и загружает их одним
+    COPY ... FROM STDIN вместо множества INSERT.
+
+    Args:
+        table: Объект pandas SQLTable.\n
+        conn: Соединение SQLAlchemy.\n
+        keys (list): Имена столбцов.\n
+        data_iter: Итератор по строкам данных.
+
+    """
+    preparer = conn.dialect.identifier_preparer
+    dbapi_connection = conn.connection
+    with dbapi_connection.cursor() as cursor:
+        buffer = StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows(data_iter)
+        buffer.seek(0)
+        columns = ", ".join(preparer.quote(key) for key in keys)
+        if table.schema:
+            table_name = f"{preparer.quote(table.schema)}.{preparer.quote(table.name)}"
+        else:
+            table_name = preparer.quote(table.name)
+        cursor.copy_expert(
+            f"COPY {table_name} ({columns}) FROM STDIN WITH CSV", buffer
+        )
+
+
+def measure_execution_time(func):
+    """
+    Декоратор для измерения времени выполнения функции.
+
+    Args:
+        func: Функция, к которой применяется декоратор.
+
+    Returns:
+        wrapper: Обертка вокруг исходной функции с измерением времени выполнения.
+
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start_time = time.perf_counter_ns()
+        result = func(*args, **kwargs)
+        elapsed_ns = time.perf_counter_ns() - start_time
+        print(f"Время выполнения: {elapsed_ns / 1e9:.6f}s")
+        return result
+
+    return wrapper
+
+
+class DatabaseAPI:
+    def __init__(self, host, username, password, database_name):
+        """
+        Инициализация объекта DatabaseAPI.
+
+        Args:
+            host (str): Хост базы данных.\n
+            username (str): Имя пользователя для подключения к базе данных.\n
+            password (str): Пароль пользователя для подключения к базе данных.\n
+            database_name (str): Имя базы данных.
+
+        """
+        self.host = host
+        self.username = username
+        self.password = password
+        self.database_name = database_name
+        self.engine = self.create_connection()
+        self._conn = None
+
+    def create_connection(self):
+        """
+        Создание соединения с базой данных.
+
+        Returns:
+            engine: Объект SQLAlchemy Engine для подключения к базе данных.
+
+        """
+        from sqlalchemy import create_engine
+
+        connection_url = f"postgresql+psycopg2://{self.username}:{self.password}@{self.host}/{self.database_name}"
+        engine = create_engine(
+            connection_url,
+            executemany_mode="values_plus_batch",
+            insertmanyvalues_page_size=1000,
+            executemany_batch_page_size=500,
+            pool_size=10,
+            max_overflow=20,
+            pool_pre_ping=True,
+            pool_recycle=1800,
+        )
+        return engine
+
+    def _connection(self):
+        """
+        Получение долгоживущего соединения с базой данных.
+
+        Соединение открывается один раз и переиспользуется между вызовами,
+        чтобы не платить за установку соединения при каждой операции.
+
+        Каждый вызывающий обязан завершить свою транзакцию до возврата —
+        выполнять запросы внутри ``with conn.begin():`` (в том числе
+        чтения: SQLAlchemy 2.x автоматически открывает транзакцию при
+        первом ``execute``). Незавершенная транзакция оставляет сессию в
+        состоянии idle-in-transaction на все время жизни процесса и
+        ломает следующий ``conn.begin()``.
+
+        Returns:
+            conn: Объект SQLAlchemy Connection.
+
+        """
+        if self._conn is None or self._conn.closed:
+            self._conn = self.engine.connect()
+        if self._conn.in_transaction():
+            self._conn.rollback()
+        return self._conn
+
+    def _quote_ident(self, name):
+        """
+        Экранирование идентификатора (имени таблицы или столбца).
+
+        Защищает от SQL-инъекций через имена, приходящие от вызывающего
+        кода, и корректно обрабатывает регистр и спецсимволы.
+
+        Args:
+            name (str): Имя таблицы или столбца.
+
+        Returns:
+            str: Экранированный идентификатор.
+
+        """
+        return self.engine.dialect.identifier_preparer.quote(name)
+
+    def _table_exists(self, table_name):
+        """
+        Проверка существования таблицы одним запросом к to_regclass.
+
+        В отличие от ``inspect(engine).get_table_names()``, не сканирует
+        весь каталог, а выполняет один быстрый запрос.
+
+        Args:
+            table_name (str): Имя проверяемой таблицы.
+
+        Returns:
+            bool: True, если таблица существует.
+
+        """
+        conn = self._connection()
+        with conn.begin():
+            exists = conn.execute(
+                _exists_statement(), {"table_name": table_name}
+            ).scalar()
+        return bool(exists)
+
+    def _copy_from_df(
+        self, table_name, dataframe, chunksize=None, fast_bulk=False, binary=False
+    ):
+        """
+        Быстрая загрузка DataFrame в таблицу через COPY ... FROM STDIN.
+
+        В отличие от построчных INSERT, COPY передает данные одним потоком,
+        что на больших объемах сокращает время загрузки в разы. При
+        указании ``chunksize`` данные грузятся порциями, но в одной
+        транзакции — ошибка откатывает загрузку целиком.
+
+        Args:
+            table_name (str): Имя таблицы, в которую загружаются данные.\n
+            dataframe (pd.DataFrame): DataFrame с данными для загрузки.\n
+            chunksize (int): Число строк в одной порции COPY.\n
+            fast_bulk (bool): Включить SET LOCAL-настройки ускоренной
+                загрузки на время транзакции.\n
+            binary (bool): Использовать бинарный COPY. Только если типы
+                столбцов таблицы точно совпадают с packers (например,
+                таблица создана через ``_build_create_ddl``): сервер
+                отвергает бинарный поток при несовпадении типов (скажем,
+                int64 в столбец INTEGER или NUMERIC), которое текстовый
+                формат переживает без проблем.
+
+        """
+        if binary and all(str(dtype) in BINARY_PACKERS for dtype in dataframe.dtypes):
+            self._copy_binary(
+                table_name, dataframe, chunksize=chunksize, fast_bulk=fast_bulk
+            )
+            return
+        columns = ", ".join(self._quote_ident(column) for column in dataframe.columns)
+        copy_query = (
+            f"COPY {self._quote_ident(table_name)} ({columns}) FROM STDIN "
+            "WITH (FORMAT CSV, DELIMITER E'\\t', NULL '\\N')"
+        )
+        if chunksize is None:
+            chunksize = len(dataframe) or 1
+        raw_connection = self.engine.raw_connection()
+        try:
+            with raw_connection.cursor() as cursor:
+                if fast_bulk:
+                    cursor.execute(FAST_BULK_SETTINGS)
+                for start in range(0, len(dataframe), chunksize):
+                    buffer = StringIO()
+                    dataframe.iloc[start : start + chunksize].to_csv(
+                        buffer, index=False, header=False, sep="\t", na_rep="\\N"
+                    )
+                    buffer.seek(0)
+                    cursor.copy_expert(copy_query, buffer)
+            raw_connection.commit()
+        finally:
+            raw_connection.close()
+
+    def _copy_binary(self, table_name, dataframe, chunksize=None, fast_bulk=False):
+        """
+        Загрузка DataFrame через COPY ... WITH (FORMAT BINARY).
+
+        Для чисто числовых/временных столбцов бинарный формат избавляет
+        обе стороны от сериализации и разбора текста: значения пишутся
+        напрямую через struct.pack в формате протокола PostgreSQL.
+
+        Args:
+            table_name (str): Имя таблицы, в которую загружаются данные.\n
+            dataframe (pd.DataFrame): DataFrame с данными (только типы из
+                ``BINARY_PACKERS``).\n
+            chunksize (int): Число строк в одной порции COPY.\n
+            fast_bulk (bool): Включить SET LOCAL-настройки ускоренной
+                загрузки на время транзакции.
+
+        """
+        import pandas as pd
+
+        columns = ", ".join(self._quote_ident(column) for column in dataframe.columns)
+        copy_query = (
+            f"COPY {self._quote_ident(table_name)} ({columns}) "
+            "FROM STDIN WITH (FORMAT BINARY)"
+        )
+        packers = [BINARY_PACKERS[str(dtype)] for dtype in dataframe.dtypes]
+        field_count = struct.pack("!h", len(packers))
+        if chunksize is None:
+            chunksize = len(dataframe) or 1
+        raw_connection = self.engine.raw_connection()
+        try:
+            with raw_connection.cursor() as cursor:
+                if fast_bulk:
+                    cursor.execute(FAST_BULK_SETTINGS)
+                for start in range(0, len(dataframe), chunksize):
+                    chunk = dataframe.iloc[start : start + chunksize]
+                    # Поколоночные numpy-буферы вместо itertuples: строки
+                    # не материализуются в кортежи pandas-объектов.
+                    arrays = [
+                        chunk[column].to_numpy(copy=False)
+                        for column in chunk.columns
+                    ]
+                    buffer = BytesIO()
+                    buffer.write(PG_BINARY_HEADER)
+                    for row in zip(*arrays):
+                        buffer.write(field_count)
+                        for value, packer in zip(row, packers):
+                            if pd.isna(value):
+                                buffer.write(PG_NULL_FIELD)
+                            else:
+                                buffer.write(packer(value))
+                    buffer.write(PG_BINARY_TRAILER)
+                    buffer.seek(0)
+                    cursor.copy_expert(copy_query, buffer)
+            raw_connection.commit()
+        finally:
+            raw_connection.close()
+
+    def _replace_via_staging(
+        self, table_name, dataframe, chunksize=None, fast_bulk=False
+    ):
+        """
+        Замена содержимого таблицы через промежуточную таблицу и переименование.
+
+        Данные грузятся в UNLOGGED-копию таблицы (без записи в WAL), после
+        чего таблицы атомарно меняются местами одним переименованием —
+        читатели не видят пустую таблицу между очисткой и загрузкой.
+        Копия создается с INCLUDING ALL, так что индексы и ограничения
+        исходной таблицы сохраняются (индексы наполняются по ходу COPY).
+        Права доступа (GRANT) и внешние ключи, ссылающиеся на таблицу,
+        через LIKE не переносятся — при необходимости их нужно
+        восстановить отдельно.
+
+        Args:
+            table_name (str): Имя заменяемой таблицы.\n
+            dataframe (pd.DataFrame): DataFrame с новым содержимым.\n
+            chunksize (int): Число строк в одной порции COPY.\n
+            fast_bulk (bool): Включить SET LOCAL-настройки ускоренной
+                загрузки на время транзакции.
+
+        """
+        from sqlalchemy import text
+
+        staging_name = f"{table_name}_stg"
+        quoted_table = self._quote_ident(table_name)
+        quoted_staging = self._quote_ident(staging_name)
+        conn = self._connection()
+        with conn.begin():
+            conn.execute(text(f"DROP TABLE IF EXISTS {quoted_staging}"))
+            conn.execute(
+                text(
+                    f"CREATE UNLOGGED TABLE {quoted_staging} "
+                    f"(LIKE {quoted_table} INCLUDING ALL)"
+                )
+            )
+        self._copy_from_df(
+            staging_name, dataframe, chunksize=chunksize, fast_bulk=fast_bulk
+        )
+        with conn.begin():
+            conn.execute(text(f"DROP TABLE {quoted_table}"))
+            conn.execute(text(f"ALTER TABLE {quoted_staging} RENAME TO {quoted_table}"))
+            conn.execute(text(f"ALTER TABLE {quoted_table} SET LOGGED"))
+
+    def _execute_values_insert(self, table_name, dataframe, page_size=500):
+        """
+        Вставка DataFrame одним многострочным INSERT через execute_values.
+
+        Переписывает N отдельных INSERT в INSERT ... VALUES (row1),(row2),...
+        — средний путь между 'multi' и COPY, полезный и для таблиц с
+        триггерами, которые ведут себя иначе под COPY.
+
+        Args:
+            table_name (str): Имя таблицы, в которую вставляются данные.\n
+            dataframe (pd.DataFrame): DataFrame с данными для вставки.\n
+            page_size (int): Число строк в одном VALUES-блоке.
+
+        """
+        from psycopg2.extras import execute_values
+
+        columns = ", ".join(self._quote_ident(column) for column in dataframe.columns)
+        insert_query = (
+            f"INSERT INTO {self._quote_ident(table_name)} ({columns}) VALUES %s"
+        )
+        raw_connection = self.engine.raw_connection()
+        try:
+            with raw_connection.cursor() as cursor:
+                # itertuples ленив (кортежи создаются по мере отправки
+                # страниц) и отдает нативные Python-скаляры — numpy-типы
+                # psycopg2 адаптировать не умеет, а to_numpy() к тому же
+                # приводил бы смешанные int/float колонки к float64.
+                execute_values(
+                    cursor,
+                    insert_query,
+                    dataframe.itertuples(index=False, name=None),
+                    page_size=page_size,
+                )
+            raw_connection.commit()
+        finally:
+            raw_connection.close()
+
+    def _build_create_ddl(self, table_name, dataframe):
+        """
+        Построение DDL-запроса CREATE TABLE по типам столбцов DataFrame.
+
+        Args:
+            table_name (str): Имя создаваемой таблицы.\n
+            dataframe (pd.DataFrame): DataFrame, задающий схему таблицы.
+
+        Returns:
+            str: Запрос CREATE TABLE.
+
+        """
+        type_map = {
+            "int8": "SMALLINT",
+            "int16": "SMALLINT",
+            "int32": "INTEGER",
+            "int64": "BIGINT",
+            "uint8": "SMALLINT",
+            "uint16": "INTEGER",
+            "uint32": "BIGINT",
+            "uint64": "NUMERIC",
+            "Int16": "SMALLINT",
+            "Int32": "INTEGER",
+            "Int64": "BIGINT",
+            "float32": "REAL",
+            "float64": "DOUBLE PRECISION",
+            "Float32": "REAL",
+            "Float64": "DOUBLE PRECISION",
+            "bool": "BOOLEAN",
+            "boolean": "BOOLEAN",
+            "datetime64[ns]": "TIMESTAMP",
+        }
+        string_like = ("object", "string", "str")
+        column_defs = []
+        for column, dtype in dataframe.dtypes.items():
+            dtype_name = str(dtype)
+            if dtype_name in type_map:
+                pg_type = type_map[dtype_name]
+            elif dtype_name in string_like:
+                pg_type = "TEXT"
+            else:
+                raise ValueError(
+                    f"Неподдерживаемый тип столбца {column}: {dtype_name}. "
+                    "Добавьте его в type_map или приведите DataFrame к "
+                    "поддерживаемым типам."
+                )
+            column_defs.append(f"{self._quote_ident(column)} {pg_type}")
+        return (
+            f"CREATE TABLE {self._quote_ident(table_name)} "
+            f"({', '.join(column_defs)})"
+        )
+
+    @measure_execution_time
+    def create_table(self, table_name, dataframe):
+        """
+        Создание таблицы в базе данных на основе DataFrame.
+
+        Args:
+            table_name (str): Имя таблицы.\n
+            dataframe (pd.DataFrame): DataFrame, который будет использован для создания таблицы.
+
+        """
+        from sqlalchemy import text
+
+        if self._table_exists(table_name):
+            print(f"Таблица {table_name} уже существует. Нельзя создать таблицу.")
+        else:
+            conn = self._connection()
+            with conn.begin():
+                conn.execute(text(self._build_create_ddl(table_name, dataframe)))
+            # Таблица только что создана по dtypes этого же DataFrame,
+            # поэтому бинарный COPY здесь заведомо совместим по типам.
+            self._copy_from_df(table_name, dataframe, binary=True)
+            print(f"Таблица {table_name} успешно создана.")
+
+    def _insert_df(
+        self, table_name, dataframe, method=None, chunksize=10000, fast_bulk=False
+    ):
+        """
+        Вставка DataFrame с выбором способа по размеру данных.
+
+        Маленькие DataFrame вставляются через многострочный INSERT
+        (``method='multi'``), большие — через COPY. Явно переданный
+        ``method`` имеет приоритет. Для PostgreSQL обычно оптимальны
+        порции в 5–50 тыс. строк.
+
+        Args:
+            table_name (str): Имя таблицы, в которую вставляются данные.\n
+            dataframe (pd.DataFrame): DataFrame с данными для вставки.\n
+            method: Callable или строка для ``pandas.to_sql``, либо None
+                для автоматического выбора.\n
+            chunksize (int): Число строк в одной порции вставки.\n
+            fast_bulk (bool): Отключить на время загрузки синхронный
+                коммит и поднять maintenance_work_mem.
+
+        """
+        if method is None:
+            if len(dataframe) >= COPY_THRESHOLD:
+                self._copy_from_df(
+                    table_name, dataframe, chunksize=chunksize, fast_bulk=fast_bulk
+                )
+                return
+            if len(dataframe) >= EXECUTE_VALUES_THRESHOLD:
+                self._execute_values_insert(table_name, dataframe)
+                return
+            method = "multi"
+        dataframe.to_sql(
+            table_name,
+            self.engine,
+            if_exists="append",
+            index=False,
+            method=method,
+            chunksize=chunksize,
+        )
+
+    @measure_execution_time
+    def insert_sql(
+        self,
+        table_name,
+        dataframe,
+        mode,
+        method=None,
+        chunksize=10000,
+        fast_bulk=False,
+    ):
+        """
+        Вставка данных в таблицу базы данных.
+
+        Args:
+            table_name (str): Имя таблицы, в которую будут вставлены данные.\n
+            dataframe (pd.DataFrame): DataFrame, содержащий данные для вставки.\n
+            mode (str): Режим вставки ('append' или 'replace').\n
+            method: Способ вставки для ``pandas.to_sql`` (например,
+                ``psql_copy_insert`` или 'multi'). По умолчанию выбирается
+                автоматически по числу строк.\n
+            chunksize (int): Число строк в одной порции вставки.\n
+            fast_bulk (bool): Включить ускоренный режим загрузки: WAL не
+                ждет fsync (SET LOCAL synchronous_commit = OFF), больше
+                памяти на обслуживание индексов. Подходит для данных,
+                которые можно перезагрузить при сбое сервера.
+
+        """
+        if not self._table_exists(table_name):
+            print(
+                f"Таблица {table_name} не существует. Данные не могут быть добавлены."
+            )
+        else:
+            if mode == "append":
+                self._insert_df(table_name, dataframe, method, chunksize, fast_bulk)
+                print(f"Данные успешно добавлены в таблицу {table_name}.")
+            elif mode == "replace":
+                self._replace_via_staging(
+                    table_name, dataframe, chunksize=chunksize, fast_bulk=fast_bulk
+                )
+                print(f"Данные успешно добавлены в таблицу {table_name}.")
+
+    @measure_execution_time
+    def truncate_table(self, table_name):
+        """
+        Очистка таблицы (удаление всех данных).
+
+        Args:
+            table_name (str): Имя таблицы, которую необходимо очистить.
+
+        """
+        from sqlalchemy import text
+
+        if not self._table_exists(table_name):
+            print(f"Таблица {table_name} не существует. Нельзя выполнить очистку.")
+        else:
+            conn = self._connection()
+            with conn.begin():
+                truncate_query = text(
+                    f"TRUNCATE TABLE {self._quote_ident(table_name)}"
+                )
+                conn.execute(truncate_query)
+            print(f"Таблица {table_name} успешно очищена.")
+
+    def _read_sql_arrow(self, query):
+        """
+        Чтение результата запроса через connectorx в формате Arrow.
+
+        connectorx (реализован на Rust) читает данные в Arrow-таблицу в
+        обход текстового протокола psycopg2 и block manager pandas, что
+        дает кратный выигрыш на больших выборках.
+
+        Args:
+            query (str): SELECT-запрос для выполнения.
+
+        Returns:
+            pd.DataFrame: DataFrame с Arrow-типами столбцов (без
+            копирования данных).
+
+        """
+        import connectorx
+        import pandas as pd
+
+        dsn = f"postgresql://{self.username}:{self.password}@{self.host}/{self.database_name}"
+        table = connectorx.read_sql(dsn, query, return_type="arrow")
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    @measure_execution_time
+    def read_sql(self, table_name, chunksize=None, as_iterator=False, backend="pandas"):
+        """
+        Чтение данных из таблицы и возврат их в виде DataFrame.
+
+        При указании ``chunksize`` используется серверный курсор, и данные
+        читаются порциями — память ограничена размером одной порции, а не
+        всей таблицы.
+
+        Args:
+            table_name (str): Имя таблицы, из которой необходимо прочитать данные.\n
+            chunksize (int): Размер порции строк при потоковом чтении.\n
+            as_iterator (bool): Вернуть итератор по порциям вместо
+                склеенного DataFrame (только вместе с ``chunksize``).\n
+            backend (str): 'pandas' (по умолчанию) или 'arrow' — чтение
+                через connectorx в Arrow-таблицу без двойной буферизации.
+
+        Returns:
+            pd.DataFrame: DataFrame с данными из таблицы, либо итератор
+            DataFrame при ``as_iterator=True``.
+
+        """
+        import pandas as pd
+
+        if not self._table_exists(table_name):
+            print(f"Таблица {table_name} не существует. Невозможно прочитать данные.")
+            return None
+        else:
+            query = f"SELECT * FROM {self._quote_ident(table_name)}"
+            if backend == "arrow":
+                return self._read_sql_arrow(query)
+            if chunksize is not None:
+                chunks = pd.read_sql_query(
+                    query,
+                    self.engine.execution_options(stream_results=True),
+                    chunksize=chunksize,
+                )
+                if as_iterator:
+                    return chunks
+                return pd.concat(list(chunks), ignore_index=True)
+            result = pd.read_sql_query(query, self.engine)
+            return result
+
+    @measure_execution_time
+    def delete_from_table(self, table_name, *columns, **conditions):
+        """
+        Удаление данных из таблицы на основе указанных столбцов и условий.
+
+        Значения условий могут быть как скалярами (удаление по одному
+        набору значений), так и списками одинаковой длины — тогда все
+        наборы ключей удаляются одним запросом вместо N отдельных.
+        Вместо столбцов и условий можно передать один список словарей:
+        каждый словарь задает один набор значений ключа для удаления.
+
+        Args:
+            table_name (str): Имя таблицы, из которой необходимо удалить данные.\n
+            \*columns (str): Список столбцов, по которым выполняется условие
+                удаления, либо один список словарей с условиями.\n
+            **conditions: Условия для удаления данных (скаляры или списки).
+
+        """
+        if not self._table_exists(table_name):
+            print(f"Таблица {table_name} не существует. Невозможно удалить данные.")
+        else:
+            if (
+                len(columns) == 1
+                and isinstance(columns[0], list)
+                and not conditions
+            ):
+                condition_dicts = columns[0]
+                if not condition_dicts:
+                    print(
+                        f"Нет условий для удаления из таблицы {table_name}. "
+                        "Нечего удалять."
+                    )
+                    return
+                key_columns = tuple(condition_dicts[0])
+                if any(
+                    set(condition) != set(key_columns)
+                    for condition in condition_dicts
+                ):
+                    print(
+                        "Условия для удаления содержат разные наборы столбцов. "
+                        "Нечего удалять."
+                    )
+                    return
+                rows = [
+                    tuple(condition[column] for column in key_columns)
+                    for condition in condition_dicts
+                ]
+                self._delete_rows(table_name, key_columns, rows)
+                print(f"Данные в таблице {table_name} успешно удалены.")
+            elif not columns or not conditions:
+                print("Не указаны столбцы и условия для удаления.")
+            elif any(
+                isinstance(conditions[column], (list, tuple)) for column in columns
+            ):
+                values = [conditions[column] for column in columns]
+                lengths = {
+                    len(value)
+                    for value in values
+                    if isinstance(value, (list, tuple))
+                }
+                if len(lengths) > 1:
+                    print(
+                        "Списки условий для удаления имеют разную длину. "
+                        "Нечего удалять."
+                    )
+                    return
+                row_count = lengths.pop()
+                if row_count == 0:
+                    print(
+                        f"Нет условий для удаления из таблицы {table_name}. "
+                        "Нечего удалять."
+                    )
+                    return
+                # Скалярные условия растягиваются на все удаляемые наборы.
+                rows = list(
+                    zip(
+                        *(
+                            value
+                            if isinstance(value, (list, tuple))
+                            else [value] * row_count
+                            for value in values
+                        )
+                    )
+                )
+                self._delete_rows(table_name, columns, rows)
+                print(f"Данные в таблице {table_name} успешно удалены.")
+            else:
+                conn = self._connection()
+                with conn.begin():
+                    delete_query = _compile_delete(
+                        self._quote_ident(table_name),
+                        tuple(columns),
+                        tuple(self._quote_ident(column) for column in columns),
+                    )
+                    conn.execute(delete_query, conditions)
+                print(f"Данные в таблице {table_name} успешно удалены.")
+
+    def _delete_rows(self, table_name, columns, rows):
+        """
+        Удаление набора строк по ключам одним запросом через (...) IN %s.
+
+        Кортежи ключей уходят на сервер страницами execute_values, а
+        планировщик сворачивает список в хеш-агрегат — одна отправка
+        вместо N отдельных DELETE.
+
+        Args:
+            table_name (str): Имя таблицы, из которой удаляются данные.\n
+            columns (tuple): Столбцы, образующие ключ удаления.\n
+            rows (list): Кортежи значений ключа для удаления.
+
+        """
+        from psycopg2.extras import execute_values
+
+        quoted_table = self._quote_ident(table_name)
+        column_list = ", ".join(self._quote_ident(column) for column in columns)
+        delete_query = f"DELETE FROM {quoted_table} WHERE ({column_list}) IN (%s)"
+        raw_connection = self.engine.raw_connection()
+        try:
+            with raw_connection.cursor() as cursor:
+                execute_values(cursor, delete_query, rows, page_size=1000)
+            raw_connection.commit()
+        finally:
+            raw_connection.close()
+
+    def _select_via_copy(self, query):
+        """
+        Выполнение SELECT через COPY ... TO STDOUT с разбором в pyarrow.
+
+        Сборка строк уходит из питоновских циклов в векторизованный
+        C-код pyarrow, что заметно снижает нагрузку на CPU на широких
+        результатах.
+
+        Args:
+            query (str): SELECT-запрос для выполнения.
+
+        Returns:
+            pd.DataFrame: DataFrame с результатом запроса.
+
+        """
+        from pyarrow import csv as arrow_csv
+
+        # Завершающая точка с запятой допустима в отдельном запросе, но
+        # внутри COPY (...) — синтаксическая ошибка.
+        query = query.strip().rstrip(";").rstrip()
+        buffer = BytesIO()
+        raw_connection = self.engine.raw_connection()
+        try:
+            with raw_connection.cursor() as cursor:
+                cursor.copy_expert(
+                    f"COPY ({query}) TO STDOUT WITH CSV HEADER", buffer
+                )
+        finally:
+            raw_connection.close()
+        buffer.seek(0)
+        return arrow_csv.read_csv(buffer).to_pandas(zero_copy_only=False)
+
+    @measure_execution_time
+    def execute(self, query):
+        """
+        Выполнение произвольного SQL-запроса.
+
+        SELECT-запросы выполняются через COPY TO STDOUT и возвращаются
+        как DataFrame, если установлен pyarrow; без него (и для всех
+        остальных запросов) используется обычный путь через text().
+
+        Args:
+            query (str): SQL-запрос для выполнения.
+
+        Returns:
+            result: DataFrame для SELECT-запросов (при наличии pyarrow),
+            иначе результат выполнения SQL-запроса.
+
+        """
+        from sqlalchemy import text
+
+        if query.lstrip().upper().startswith("SELECT"):
+            try:
+                return self._select_via_copy(query)
+            except ImportError:
+                # pyarrow — необязательная зависимость: без него SELECT
+                # выполняется по прежнему пути.
+                pass
+        conn = self._connection()
+        with conn.begin():
+            result = conn.execute(text(query))
+            return result
@@ -34,12 +34,11 @@ print(result)
 # Очистка таблицы
 db.truncate_table('sample_table')
 
-# Выполнение произвольного SQL-запроса
+# Выполнение произвольного SQL-запроса (SELECT возвращает DataFrame)
 query = "SELECT * FROM sample_table"
 result = db.execute(query)
 print("Результат SQL-запроса:")
-for row in result:
-    print(row)
+print(result)
 
 # Удаление данных из таблицы с одним условием
 table_name = "sample_table"
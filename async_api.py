@@ -0,0 +1,83 @@
+import asyncio
+
+import asyncpg
+
+
+class AsyncDatabaseAPI:
+    def __init__(self, host, username, password, database_name):
+        """
+        Инициализация объекта AsyncDatabaseAPI.
+
+        Асинхронный вариант DatabaseAPI на asyncpg: параллельные загрузки
+        нескольких таблиц или порций перекрывают сетевые задержки вместо
+        того, чтобы ждать каждую по очереди.
+
+        Args:
+            host (str): Хост базы данных.\n
+            username (str): Имя пользователя для подключения к базе данных.\n
+            password (str): Пароль пользователя для подключения к базе данных.\n
+            database_name (str): Имя базы данных.
+
+        """
+        self.host = host
+        self.username = username
+        self.password = password
+        self.database_name = database_name
+        self.pool = None
+
+    async def connect(self):
+        """
+        Создание пула соединений с базой данных.
+
+        Returns:
+            pool: Объект asyncpg.Pool для подключения к базе данных.
+
+        """
+        dsn = f"postgresql://{self.username}:{self.password}@{self.host}/{self.database_name}"
+        self.pool = await asyncpg.create_pool(dsn, min_size=4, max_size=32)
+        return self.pool
+
+    async def close(self):
+        """
+        Закрытие пула соединений.
+
+        """
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+    async def insert_sql(self, table_name, dataframe):
+        """
+        Асинхронная вставка данных в таблицу через бинарный COPY.
+
+        Args:
+            table_name (str): Имя таблицы, в которую будут вставлены данные.\n
+            dataframe (pd.DataFrame): DataFrame, содержащий данные для вставки.
+
+        """
+        async with self.pool.acquire() as conn:
+            await conn.copy_records_to_table(
+                table_name,
+                records=dataframe.itertuples(index=False, name=None),
+                columns=list(dataframe.columns),
+            )
+        print(f"Данные успешно добавлены в таблицу {table_name}.")
+
+    async def insert_many(self, tables):
+        """
+        Параллельная вставка данных в несколько таблиц.
+
+        Загрузки выполняются одновременно через asyncio.gather; на практике
+        выигрыш растет примерно до 2–4 параллельных загрузок, дальше
+        упирается в однопоточность asyncio.
+
+        Args:
+            tables (dict): Отображение имени таблицы в DataFrame с данными.
+
+        """
+        await asyncio.gather(
+            *(
+                self.insert_sql(table_name, dataframe)
+                for table_name, dataframe in tables.items()
+            )
+        )